@@ -2,4 +2,9 @@ from pydantic import ValidationError
 
 
 def stringify_pydantic_error(validation_error: ValidationError) -> str:
-    return "\n".join(f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in validation_error.errors())
+    # only loc and msg are needed, so skip materializing the url/context/input
+    # fields for every error
+    return "\n".join(
+        f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}"
+        for e in validation_error.errors(include_url=False, include_context=False, include_input=False)
+    )
@@ -1,25 +1,38 @@
 import logging
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Literal
+from urllib.parse import urlencode
 
-from pydantic import AnyUrl, BaseModel, Field, RootModel, ValidationError
+from pydantic import AnyUrl, BaseModel, Field, TypeAdapter, ValidationError
 from starlette.datastructures import FormData, QueryParams
 from starlette.requests import Request
-from starlette.responses import RedirectResponse, Response
+from starlette.responses import JSONResponse, RedirectResponse, Response
 
 from mcp.server.auth.errors import stringify_pydantic_error
-from mcp.server.auth.json_response import PydanticJSONResponse
 from mcp.server.auth.provider import (
     AuthorizationErrorCode,
     AuthorizationParams,
     AuthorizeError,
     OAuthAuthorizationServerProvider,
-    construct_redirect_uri,
 )
-from mcp.shared.auth import InvalidRedirectUriError, InvalidScopeError
+from mcp.shared.auth import InvalidRedirectUriError, InvalidScopeError, OAuthClientInformationFull
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of client records kept in the per-handler cache;
+# least-recently-used entries are evicted beyond this.
+_CLIENT_CACHE_MAX_SIZE = 10_000
+
+# shared across responses; Starlette copies the mapping into its own headers
+_NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+# accepted values for the two Literal fields of AuthorizationRequest, checked
+# up front so the common invalid cases never reach Pydantic
+_ALLOWED_RESPONSE_TYPES = frozenset({"code"})
+_ALLOWED_CODE_CHALLENGE_METHODS = frozenset({"S256"})
+
 
 class AuthorizationRequest(BaseModel):
     # See https://datatracker.ietf.org/doc/html/rfc6749#section-4.1.1
@@ -41,6 +54,11 @@ class AuthorizationRequest(BaseModel):
     )
 
 
+# hoisted to module scope so the validators are built once, not per request
+_AUTH_REQUEST_ADAPTER: TypeAdapter[AuthorizationRequest] = TypeAdapter(AuthorizationRequest)
+_ANY_URL_ADAPTER: TypeAdapter[AnyUrl] = TypeAdapter(AnyUrl)
+
+
 class AuthorizationErrorResponse(BaseModel):
     error: AuthorizationErrorCode
     error_description: str | None
@@ -49,22 +67,60 @@ class AuthorizationErrorResponse(BaseModel):
     state: str | None = None
 
 
-def best_effort_extract_string(key: str, params: None | FormData | QueryParams) -> str | None:
-    if params is None:
-        return None
+def _get_str_param(params: FormData | QueryParams, key: str) -> str | None:
     value = params.get(key)
-    if isinstance(value, str):
-        return value
-    return None
-
+    return value if isinstance(value, str) else None
 
-class AnyUrlModel(RootModel[AnyUrl]):
-    root: AnyUrl
 
-
-@dataclass
+@dataclass(slots=True)
 class AuthorizationHandler:
     provider: OAuthAuthorizationServerProvider[Any, Any, Any]
+    # How long (in seconds) to cache `provider.get_client` results; <= 0 disables
+    # caching. Client metadata rarely changes, and the handler may need to look up
+    # the same client twice in a single request (once on the happy path and again
+    # in the error fallback), so even a short TTL avoids most provider roundtrips.
+    client_cache_ttl: float = 300.0
+    # client_id -> (expiry, client, resolved redirect URIs); the redirect cache
+    # lives inside the client entry so both expire and evict together
+    _client_cache: OrderedDict[str, tuple[float, OAuthClientInformationFull, dict[AnyUrl | None, AnyUrl]]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    async def _get_client_cached(self, client_id: str) -> OAuthClientInformationFull | None:
+        if self.client_cache_ttl <= 0:
+            return await self.provider.get_client(client_id)
+        now = time.monotonic()
+        cached = self._client_cache.get(client_id)
+        if cached is not None:
+            if cached[0] > now:
+                self._client_cache.move_to_end(client_id)
+                return cached[1]
+            del self._client_cache[client_id]
+        client = await self.provider.get_client(client_id)
+        if client is not None:
+            # only cache positive lookups, so an unknown client becomes usable
+            # immediately after registration
+            while len(self._client_cache) >= _CLIENT_CACHE_MAX_SIZE:
+                self._client_cache.popitem(last=False)
+            self._client_cache[client_id] = (now + self.client_cache_ttl, client, {})
+        return client
+
+    def _validate_redirect_uri_cached(self, client: OAuthClientInformationFull, redirect_uri: AnyUrl | None) -> AnyUrl:
+        """Resolve a requested redirect URI against the client, caching successes.
+
+        The resolution is deterministic for a given client record, so cache it in
+        the client's cache entry; the identity check keeps us from serving results
+        computed for a stale copy of the client. Failures propagate uncached.
+        """
+        cached = self._client_cache.get(client.client_id)
+        if cached is None or cached[1] is not client:
+            return client.validate_redirect_uri(redirect_uri)
+        resolved_uris = cached[2]
+        resolved = resolved_uris.get(redirect_uri)
+        if resolved is None:
+            resolved = client.validate_redirect_uri(redirect_uri)
+            resolved_uris[redirect_uri] = resolved
+        return resolved
 
     async def handle(self, request: Request) -> Response:
         # implements authorization requests for grant_type=code;
@@ -72,8 +128,16 @@ class AuthorizationHandler:
 
         state = None
         redirect_uri = None
+        # AnyUrl.__str__ reassembles the URL from its parsed parts, so stringify
+        # the validated redirect URI at most once per request
+        redirect_uri_str: str | None = None
         client = None
-        params = None
+
+        # extracted once from the request parameters, so the error fallback does
+        # not have to re-scan the multidict
+        raw_client_id: str | None = None
+        raw_redirect_uri: str | None = None
+        redirect_uri_provided = False
 
         async def error_response(
             error: AuthorizationErrorCode,
@@ -92,51 +156,51 @@ class AuthorizationHandler:
             # This logic is a bit awkward to handle, because the error might be thrown
             # very early in request validation, before we've done the usual Pydantic
             # validation, loaded the client, etc. To handle this, error_response()
-            # contains fallback logic which attempts to load the parameters directly
-            # from the request.
+            # contains fallback logic which works from the raw parameters extracted
+            # up front in handle().
 
-            nonlocal client, redirect_uri, state
-            if client is None and attempt_load_client:
+            nonlocal client, redirect_uri, redirect_uri_str
+            if client is None and attempt_load_client and raw_client_id:
                 # make last-ditch attempt to load the client
-                client_id = best_effort_extract_string("client_id", params)
-                client = client_id and await self.provider.get_client(client_id)
+                client = await self._get_client_cached(raw_client_id)
             if redirect_uri is None and client:
                 # make last-ditch effort to load the redirect uri
                 try:
-                    if params is not None and "redirect_uri" not in params:
-                        raw_redirect_uri = None
-                    else:
-                        raw_redirect_uri = AnyUrlModel.model_validate(
-                            best_effort_extract_string("redirect_uri", params)
-                        ).root
-                    redirect_uri = client.validate_redirect_uri(raw_redirect_uri)
+                    parsed_redirect_uri = (
+                        _ANY_URL_ADAPTER.validate_python(raw_redirect_uri) if redirect_uri_provided else None
+                    )
+                    redirect_uri = self._validate_redirect_uri_cached(client, parsed_redirect_uri)
                 except (ValidationError, InvalidRedirectUriError):
                     # if the redirect URI is invalid, ignore it & just return the
                     # initial error
                     pass
 
-            # the error response MUST contain the state specified by the client, if any
-            if state is None:
-                # make last-ditch effort to load state
-                state = best_effort_extract_string("state", params)
-
-            error_resp = AuthorizationErrorResponse(
-                error=error,
-                error_description=error_description,
-                state=state,
-            )
+            # all fields are generated by this handler, so skip re-validating them
+            # and build the wire representation by hand
+            error_fields = {
+                k: v
+                for k, v in (("error", error), ("error_description", error_description), ("state", state))
+                if v is not None
+            }
 
             if redirect_uri and client:
+                # append the error fields directly rather than re-parsing the
+                # whole URL through construct_redirect_uri
+                if redirect_uri_str is None:
+                    redirect_uri_str = str(redirect_uri)
+                separator = "&" if "?" in redirect_uri_str else "?"
                 return RedirectResponse(
-                    url=construct_redirect_uri(str(redirect_uri), **error_resp.model_dump(exclude_none=True)),
+                    url=f"{redirect_uri_str}{separator}{urlencode(error_fields)}",
                     status_code=302,
-                    headers={"Cache-Control": "no-store"},
+                    headers=_NO_STORE_HEADERS,
                 )
             else:
-                return PydanticJSONResponse(
+                # error_fields is already a plain JSON-safe dict, so the stock
+                # JSONResponse encoder beats a round-trip through Pydantic's dump
+                return JSONResponse(
                     status_code=400,
-                    content=error_resp,
-                    headers={"Cache-Control": "no-store"},
+                    content=error_fields,
+                    headers=_NO_STORE_HEADERS,
                 )
 
         try:
@@ -145,27 +209,60 @@ class AuthorizationHandler:
                 # Convert query_params to dict for pydantic validation
                 params = request.query_params
             else:
-                # Parse form data for POST requests
-                params = await request.form()
+                # Parse form data for POST requests, reusing a previously parsed
+                # body if this handler re-enters via nested error handling.
+                params = getattr(request.state, "_auth_params", None)
+                if params is None:
+                    content_type = request.headers.get("content-type", "")
+                    if content_type.startswith("application/x-www-form-urlencoded"):
+                        # the overwhelmingly common case: parse the urlencoded
+                        # body directly instead of spinning up the multipart
+                        # form-parsing machinery
+                        params = QueryParams(await request.body())
+                    else:
+                        # an authorization request only carries a handful of
+                        # fields, so cap the parser allocations accordingly
+                        params = await request.form(max_files=0, max_fields=32)
+                    request.state._auth_params = params
+
+            # Extract the recovery parameters in a single pass, even before
+            # validation; the error response MUST contain the state specified by
+            # the client, if any
+            raw_client_id = _get_str_param(params, "client_id")
+            raw_redirect_uri = _get_str_param(params, "redirect_uri")
+            redirect_uri_provided = "redirect_uri" in params
+            state = _get_str_param(params, "state")
 
-            # Save state if it exists, even before validation
-            state = best_effort_extract_string("state", params)
+            # An unsupported response_type is the only validation failure that
+            # changes the outgoing error code, so check it up front rather than
+            # digging it out of a full Pydantic ValidationError below; the PKCE
+            # method gets the same treatment since both are one-value Literals.
+            response_type = params.get("response_type")
+            if response_type is not None and response_type not in _ALLOWED_RESPONSE_TYPES:
+                return await error_response("unsupported_response_type", "response_type must be 'code'")
+            code_challenge_method = params.get("code_challenge_method")
+            if code_challenge_method is not None and code_challenge_method not in _ALLOWED_CODE_CHALLENGE_METHODS:
+                return await error_response("invalid_request", "code_challenge_method must be 'S256'")
 
             try:
-                auth_request = AuthorizationRequest.model_validate(params)
+                # convert the multidict to a plain dict once, so validation works
+                # on cheap dict lookups instead of multidict accessors
+                auth_request = _AUTH_REQUEST_ADAPTER.validate_python(dict(params))
                 state = auth_request.state  # Update with validated state
             except ValidationError as validation_error:
-                error: AuthorizationErrorCode = "invalid_request"
-                for e in validation_error.errors():
-                    if e["loc"] == ("response_type",) and e["type"] == "literal_error":
-                        error = "unsupported_response_type"
-                        break
+                unsupported_rt = next(
+                    (
+                        e
+                        for e in validation_error.errors(include_url=False, include_context=False, include_input=False)
+                        if e["loc"] == ("response_type",) and e["type"] == "literal_error"
+                    ),
+                    None,
+                )
+                error: AuthorizationErrorCode = "unsupported_response_type" if unsupported_rt else "invalid_request"
                 return await error_response(error, stringify_pydantic_error(validation_error))
 
             # Get client information
-            client = await self.provider.get_client(
-                auth_request.client_id,
-            )
+            client = await self._get_client_cached(auth_request.client_id)
             if not client:
                 # For client_id validation errors, return direct error (no redirect)
                 return await error_response(
@@ -176,7 +273,8 @@ class AuthorizationHandler:
 
             # Validate redirect_uri against client's registered URIs
             try:
-                redirect_uri = client.validate_redirect_uri(auth_request.redirect_uri)
+                redirect_uri = self._validate_redirect_uri_cached(client, auth_request.redirect_uri)
+                redirect_uri_str = str(redirect_uri)
             except InvalidRedirectUriError as validation_error:
                 # For redirect_uri validation errors, return direct error (no redirect)
                 return await error_response(
@@ -194,8 +292,9 @@ class AuthorizationHandler:
                     error_description=validation_error.message,
                 )
 
-            # Setup authorization parameters
-            auth_params = AuthorizationParams(
+            # Setup authorization parameters; every field has already been
+            # validated above, so skip re-validating them
+            auth_params = AuthorizationParams.model_construct(
                 state=state,
                 scopes=scopes,
                 code_challenge=auth_request.code_challenge,
@@ -212,13 +311,15 @@ class AuthorizationHandler:
                         auth_params,
                     ),
                     status_code=302,
-                    headers={"Cache-Control": "no-store"},
+                    headers=_NO_STORE_HEADERS,
                 )
             except AuthorizeError as e:
                 # Handle authorization errors as defined in RFC 6749 Section 4.1.2.1
                 return await error_response(error=e.error, error_description=e.error_description)
 
         except Exception as validation_error:
-            # Catch-all for unexpected errors
-            logger.exception("Unexpected error in authorization_handler", exc_info=validation_error)
+            # Catch-all for unexpected errors; skip the (expensive) traceback
+            # formatting entirely when ERROR logging is filtered out
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception("Unexpected error in authorization_handler", exc_info=validation_error)
             return await error_response(error="server_error", error_description="An unexpected error occurred")
@@ -0,0 +1,84 @@
+"""
+Tests for the client-lookup cache on AuthorizationHandler.
+"""
+
+import pytest
+from pydantic import AnyUrl
+
+from mcp.server.auth.handlers.authorize import AuthorizationHandler
+from mcp.shared.auth import OAuthClientInformationFull
+
+
+class CountingProvider:
+    """Provider stub that records how often get_client is called."""
+
+    def __init__(self):
+        self.get_client_calls = 0
+        self.clients: dict[str, OAuthClientInformationFull] = {}
+
+    async def get_client(self, client_id: str) -> OAuthClientInformationFull | None:
+        self.get_client_calls += 1
+        return self.clients.get(client_id)
+
+
+@pytest.fixture
+def provider():
+    provider = CountingProvider()
+    provider.clients["client1"] = OAuthClientInformationFull(
+        client_id="client1",
+        redirect_uris=[AnyUrl("https://client.example.com/callback")],
+    )
+    return provider
+
+
+@pytest.mark.anyio
+async def test_client_cache_hit_skips_provider(provider: CountingProvider):
+    handler = AuthorizationHandler(provider)
+
+    client = await handler._get_client_cached("client1")
+    assert client is not None
+    assert await handler._get_client_cached("client1") is client
+    assert provider.get_client_calls == 1
+
+
+@pytest.mark.anyio
+async def test_client_cache_does_not_cache_misses(provider: CountingProvider):
+    handler = AuthorizationHandler(provider)
+
+    assert await handler._get_client_cached("unknown") is None
+    # a client registered after a miss must be visible immediately
+    provider.clients["unknown"] = provider.clients["client1"]
+    assert await handler._get_client_cached("unknown") is not None
+    assert provider.get_client_calls == 2
+
+
+@pytest.mark.anyio
+async def test_redirect_uri_resolution_is_cached_per_client(provider: CountingProvider):
+    handler = AuthorizationHandler(provider)
+
+    client = await handler._get_client_cached("client1")
+    assert client is not None
+
+    validate_calls = 0
+    original_validate = client.validate_redirect_uri
+
+    def counting_validate(redirect_uri: AnyUrl | None) -> AnyUrl:
+        nonlocal validate_calls
+        validate_calls += 1
+        return original_validate(redirect_uri)
+
+    object.__setattr__(client, "validate_redirect_uri", counting_validate)
+
+    first = handler._validate_redirect_uri_cached(client, None)
+    second = handler._validate_redirect_uri_cached(client, None)
+    assert first == second == AnyUrl("https://client.example.com/callback")
+    assert validate_calls == 1
+
+
+@pytest.mark.anyio
+async def test_client_cache_respects_ttl(provider: CountingProvider):
+    handler = AuthorizationHandler(provider, client_cache_ttl=0.0)
+
+    await handler._get_client_cached("client1")
+    await handler._get_client_cached("client1")
+    assert provider.get_client_calls == 2